@@ -4,6 +4,11 @@ import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import numpy as np
+try:
+   import polars as pl
+except ImportError:
+   pl = None
+from precompute import SALES_CSV, ASSESSMENTS_CSV, read_sales, read_assessments, read_tables, build_tables, write_tables
 
 # Page configuration
 st.set_page_config(
@@ -12,171 +17,405 @@ st.set_page_config(
    layout="wide"
 )
 
-# Custom CSS
-st.markdown("""
-<style>
-   /* General text styling */
-   .stMarkdown p, .stMarkdown li, .stMarkdown {
-       color: #6c757d;
-   }
-   
-   /* Headers in blue */
-   h1, h2, h3, h4, h5, h6,
-   .stMarkdown h1, .stMarkdown h2, .stMarkdown h3, 
-   .stMarkdown h4, .stMarkdown h5, .stMarkdown h6 {
-       color: #1f77b4 !important;
-   }
-   
-   /* Bold text and highlights in blue */
-   .stMarkdown strong, .stMarkdown b {
-       color: #1f77b4 !important;
-   }
-   
-   /* Metric labels in gray, values in blue */
-   [data-testid="metric-container"] label {
-       color: #6c757d !important;
-   }
-   [data-testid="metric-container"] [data-testid="stMetricValue"] {
-       color: #1f77b4 !important;
+# Median household income by year, indexed by year - INCOME_START_YEAR (2024 not yet published)
+INCOME_START_YEAR = 2000
+INCOME_BY_YEAR = np.array([
+   32903, 33223, 32785, 31363, 31246,
+   33041, 35147, 37195, 42948, 39030,
+   42240, 43980, 44535, 44601, 47218,
+   49775, 50727, 54739, 58933, 59471,
+   59598, 63470, 67177, 69829, np.nan
+], dtype=np.float64)
+
+# Custom CSS, read from disk once per server process
+@st.cache_resource
+def load_css(path='styles.css'):
+   with open(path) as f:
+       return f.read()
+
+st.markdown(f"<style>{load_css()}</style>", unsafe_allow_html=True)
+
+# Title
+st.title("Charlottesville Housing Crisis Analysis")
+st.markdown("Understanding the City of Charlottesville's Affordable Housing Crisis")
+st.markdown("**Introduction:** Since I moved to Charlottesville in 2024 I kept hearing about the housing crisis and its affect on the community. I wanted to understand the data behind these claims and see how the housing market has changed over time. I also wanted to see who owns most in the city as and how big is theis crisis. I decided to create this dashboard to visualize the data and tell the story of how the housing market has changed in Charlottesville. I hope this dashboard will help raise awareness about the housing crisis and spark discussions about possible solutions.")
+st.markdown("Data sources: City of Charlottesville Open Data Portal")
+st.markdown("Data Last updated: Jule 2024")
+
+# Each loader is cached on its file path, so a rerun only hashes a short string.
+# The frames are shared read-only across reruns (cache_resource skips the per-hit copy),
+# so callers must build new frames (assign, filtering) rather than change them in place.
+@st.cache_resource(show_spinner=False)
+def load_sales(path=SALES_CSV):
+   return read_sales(path)
+
+# Only needed by the property search; the assessment chart uses the precomputed table
+@st.cache_resource(show_spinner=False)
+def load_assessments(path=ASSESSMENTS_CSV):
+   assessments = read_assessments(path)
+   # A missing street number or name is left out, so rows missing one are still searchable
+   street_number = assessments['StreetNumber'].astype('string').fillna('')
+   street_name = assessments['StreetName'].astype('string').fillna('')
+   assessments['FullAddress'] = (street_number + ' ' + street_name).str.strip().str.upper()
+   return assessments
+
+PARCELS_CSV = 'Parcel_Boundary_Area_Details.csv'
+PARCEL_COLUMNS = ['OwnerName', 'OwnerCityState', 'LotSquareFeet', 'Assessment']
+# Whole-dollar assessments are kept as int32 like the other dollar columns
+PARCEL_DTYPES = {'OwnerName': 'category', 'OwnerCityState': 'category', 'Assessment': 'int32[pyarrow]'}
+
+@st.cache_resource(show_spinner=False)
+def load_parcels(path=PARCELS_CSV):
+   parcels = pd.read_csv(path, engine='pyarrow', dtype_backend='pyarrow', usecols=PARCEL_COLUMNS, dtype=PARCEL_DTYPES)
+   # Clean the data and identify local vs non-local owners
+   parcels = parcels.dropna(subset=['OwnerCityState'])
+   parcels['OwnerCityState_Clean'] = parcels['OwnerCityState'].astype(str).str.strip().str.upper()
+   parcels['IsLocal'] = (parcels['OwnerCityState_Clean'] == 'CHARLOTTESVILLE VA').to_numpy(dtype=bool)
+   return parcels
+
+# Yearly tables written by precompute.py. If the cache is missing or stale they are
+# rebuilt and written back, so only the first start after a data change parses the CSVs.
+@st.cache_data(show_spinner=False)
+def load_yearly_tables():
+   tables = read_tables()
+   if tables is None:
+       tables = build_tables(load_sales(), load_assessments())
+       try:
+           write_tables(tables=tables)
+       except OSError:
+           pass  # read-only deployments keep serving the in-memory tables
+   return tables
+
+# Local vs non-local parcel counts and land area, from one groupby over IsLocal
+@st.cache_data(show_spinner=False)
+def compute_ownership_summary(path=PARCELS_CSV):
+   parcel_details = load_parcels(path)
+   ownership_stats = (
+       parcel_details.groupby('IsLocal')['LotSquareFeet']
+       .agg(['sum', 'size'])
+       .reindex([True, False], fill_value=0)
+   )
+   total_parcels = len(parcel_details)
+   local_parcels = int(ownership_stats.loc[True, 'size'])
+   total_land_area = float(ownership_stats['sum'].sum())
+   local_land_area = float(ownership_stats.loc[True, 'sum'])
+   return {
+       'total_parcels': total_parcels,
+       'local_parcels': local_parcels,
+       'non_local_parcels': int(ownership_stats.loc[False, 'size']),
+       'local_pct': (local_parcels / total_parcels * 100) if total_parcels > 0 else 0,
+       'local_land_area': local_land_area,
+       'non_local_land_area': float(ownership_stats.loc[False, 'sum']),
+       'local_land_pct': (local_land_area / total_land_area * 100) if total_land_area > 0 else 0
    }
+
+OWNER_TABLE_ROWS = 200  # Largest owners listed in the property owners table
+
+# Properties, land and assessed value per owner (unsorted; callers take nlargest)
+@st.cache_data(show_spinner=False)
+def compute_top_owners(path=PARCELS_CSV):
+   # Assessment is one of PARCEL_COLUMNS, so the reader guarantees it is present
+   parcel_details = load_parcels(path)
+   if pl is not None:
+       # Polars groups on all cores; maintain_order keeps owners in file order, as sort=False does
+       top_owners = (
+           pl.from_pandas(parcel_details[['OwnerName', 'LotSquareFeet', 'Assessment']]).lazy()
+           .drop_nulls('OwnerName')
+           .group_by('OwnerName', maintain_order=True)
+           .agg(
+               pl.len().alias('TotalProperties'),
+               pl.col('LotSquareFeet').sum().alias('TotalSquareFeet'),
+               pl.col('Assessment').cast(pl.Int64).sum().alias('TotalAssessment')
+           )
+           .collect()
+           .to_pandas()
+       )
+   else:
+       # Without Polars: one stable sort on the owner codes, then a linear reduceat per column
+       codes, owners = pd.factorize(parcel_details['OwnerName'], sort=False)
+       order = np.argsort(codes, kind='stable')
+       order = order[codes[order] >= 0]  # rows without an owner are dropped, as groupby does
+       codes = codes[order]
+       starts = np.flatnonzero(np.diff(codes, prepend=-1))
+       square_feet = parcel_details['LotSquareFeet'].to_numpy(dtype=np.float64, na_value=0)[order]
+       assessment = parcel_details['Assessment'].to_numpy(dtype=np.int32, na_value=0)[order]
+       top_owners = pd.DataFrame({
+           'OwnerName': owners[codes[starts]],
+           'TotalProperties': np.diff(np.append(starts, len(codes))),
+           'TotalSquareFeet': np.add.reduceat(square_feet, starts),
+           # Accumulate in int64: the largest owner's assessments sum past int32
+           'TotalAssessment': np.add.reduceat(assessment, starts, dtype=np.int64)
+       })
+   top_owners['TotalAcres'] = top_owners['TotalSquareFeet'] / 43560
+   return top_owners
+
+# compute_top_owners, with any failure returned for the page to report instead of raised
+def safe_top_owners(path=PARCELS_CSV):
+   try:
+       return compute_top_owners(path), None
+   except Exception as e:
+       return None, e
+
+# Cached figure builders: reruns that only touch other widgets reuse the finished figures
+@st.cache_data(show_spinner=False)
+def build_top_owners_bar(path=PARCELS_CSV):
+   top_10_owners = compute_top_owners(path).nlargest(10, 'TotalProperties')
+   fig_top_owners = px.bar(
+       top_10_owners,
+       x='TotalProperties',
+       y='OwnerName',
+       title='Top 10 Owners by Number of Properties',
+       labels={'OwnerName': 'Owner Name', 'TotalProperties': 'Number of Properties'},
+       text='TotalProperties',
+       orientation='h'
+   )
+   fig_top_owners.update_traces(marker_color='#1f77b4')
+   fig_top_owners.update_layout(
+       yaxis={'categoryorder': 'total ascending'},
+       height=500
+   )
+   return fig_top_owners
+
+@st.cache_data(show_spinner=False)
+def build_assessment_fig(path=PARCELS_CSV):
+   top_10_owners = compute_top_owners(path).nlargest(10, 'TotalProperties')
+   # Create the figure 
+   fig_assessment = go.Figure()
    
-   /* Tab text */
-   .stTabs [data-baseweb="tab-list"] {
-       color: #6c757d;
-   }
+   # Sort data for the chart
+   assessment_data = top_10_owners.sort_values('TotalAssessment', ascending=True)
    
-   .impact-box {
-       background-color: #f8f9fa;
-       padding: 20px;
-       border-radius: 10px;
-       margin: 10px 0;
-       border-left: 5px solid #dc3545;
-       color: #6c757d;
-   }
-   .impact-box h3, .impact-box h4, .impact-box b {
-       color: #1f77b4 !important;
-   }
    
-   .positive-box {
-       background-color: #e7f3ff;
-       padding: 20px;
-       border-radius: 10px;
-       margin: 10px 0;
-       border-left: 5px solid #1f77b4;
-       color: #6c757d;
-   }
-   .positive-box h3, .positive-box h4, .positive-box b {
-       color: #1f77b4 !important;
-   }
+   # Highlight the top 2 bars
+   bar_colors = np.where(np.arange(len(assessment_data)) >= len(assessment_data) - 2, '#1f77b4', 'lightgray')
    
-   /* Dataframe text */
-   .stDataFrame {
-       color: #6c757d;
-   }
+   fig_assessment.add_trace(go.Bar(
+       x=assessment_data['TotalAssessment'],
+       y=assessment_data['OwnerName'],
+       orientation='h',
+       marker_color=bar_colors,
+       showlegend=False,
+       text=assessment_data['TotalAssessment'].map('${:,.0f}'.format),
+       textposition='outside',
+       hovertemplate='%{text}<extra></extra>'
+   ))
    
-   /* Info boxes */
-   .stAlert {
-       color: #6c757d;
-   }
+   # layout
+   fig_assessment.update_layout(
+       title=dict(
+           text='Top 10 Property Owners by Total Assessment Value',
+           font=dict(color='#1f77b4', size=20)
+       ),
+       xaxis_title='Total Assessment Value ($)',
+       yaxis_title='',
+       height=600,
+       margin=dict(l=300),
+       font=dict(color='#6c757d'),
+       xaxis=dict(
+           gridcolor='lightgray',
+           tickformat='$,.0f'
+       ),
+       bargap=0.15,
+       barmode='overlay'
+   )
    
-   /* Input labels */
-   .stTextInput label {
-       color: #6c757d !important;
-   }
+   # Add annotation 
+   fig_assessment.add_annotation(
+       x=assessment_data.iloc[-1]['TotalAssessment'] * 0.8,  
+       y=len(assessment_data) - 1.5,  
+       text="<b>Key Finding:</b><br>The top property owner by<br>assessment value controls significantly<br>more valuable real estate than all other major owners combined.<br>While the City of Charlottesville owns more properties in the city<br> by number and land size, the university dwarfs top property owners by assessed value",
+       showarrow=True,
+       arrowhead=2,
+       arrowsize=1,
+       arrowwidth=2,
+       arrowcolor="gray",
+       ax=0,    
+       ay=100,  
+       bgcolor="rgba(255,255,255,0.9)",
+       bordercolor="rgba(0,0,0,0)",
+       borderwidth=0,
+       font=dict(size=12, color="gray"),
+       align="center"
+   )
+   return fig_assessment
+
+@st.cache_data(show_spinner=False)
+def build_ownership_pie(local_parcels, non_local_parcels):
+   fig = go.Figure(go.Pie(
+       labels=['Local', 'Non-Local'],
+       values=[local_parcels, non_local_parcels],
+       marker=dict(colors=['#2E8B57', '#DC143C'])
+   ))
    
-   /* Selectbox labels */
-   .stSelectbox label {
-       color: #6c757d !important;
-   }
-</style>
-""", unsafe_allow_html=True)
+   fig.update_layout(
+       title='Local vs Non-Local Ownership',
+       height=400,
+       width=400,
+       showlegend=True,
+       legend=dict(orientation="v", yanchor="top", y=1, xanchor="left", x=1.05)
+   )
+   return fig
 
-# Title
-st.title("Charlottesville Housing Crisis Analysis")
-st.markdown("Understanding the City of Charlottesville's Affordable Housing Crisis")
-st.markdown("**Introduction:** Since I moved to Charlottesville in 2024 I kept hearing about the housing crisis and its affect on the community. I wanted to understand the data behind these claims and see how the housing market has changed over time. I also wanted to see who owns most in the city as and how big is theis crisis. I decided to create this dashboard to visualize the data and tell the story of how the housing market has changed in Charlottesville. I hope this dashboard will help raise awareness about the housing crisis and spark discussions about possible solutions.")
-st.markdown("Data sources: City of Charlottesville Open Data Portal")
-st.markdown("Data Last updated: Jule 2024")
+# Address lookup table for the property search, kept as a shared Polars frame
+@st.cache_resource(show_spinner=False)
+def load_address_index():
+   return pl.from_pandas(load_assessments()[['ParcelNumber', 'FullAddress']])
+
+MIN_SEARCH_LENGTH = 3
 
-# Load all data
+# Find assessment rows whose address contains query, an uppercased search string.
+# Results are cached per query, so reruns from the results selectbox skip the scan.
+@st.cache_data(show_spinner=False, max_entries=100)
+def search_addresses(query):
+   # FullAddress is stored uppercase, so a literal substring match is enough
+   if pl is not None:
+       addresses = load_address_index()
+       return addresses.filter(pl.col('FullAddress').str.contains(query, literal=True)).to_pandas()
+
+   all_assessments = load_assessments()
+   return all_assessments.loc[
+       all_assessments['FullAddress'].str.contains(query, na=False, regex=False),
+       ['ParcelNumber', 'FullAddress']
+   ]
+
+# Overview metrics, cached on the sales file and the income they are measured against
 @st.cache_data(show_spinner=False)
+def compute_overview_metrics(median_income, path=SALES_CSV):
+   sales = load_sales(path)
+   affordable_home_price = median_income * 3  # Traditional affordability ratio
+   
+   # Slice the sale amounts once per period and reuse them for every metric below
+   sales_since_2024 = sales.loc[sales['Year'] >= 2024, 'SaleAmount']
+   sales_since_2020 = sales.loc[sales['Year'] >= 2020, 'SaleAmount']
+   median_price = sales_since_2024.median()
+   older_prices = sales_since_2020.median()
+   
+   homes_affordable = int((sales_since_2020 <= affordable_home_price).sum())
+   total_recent_sales = len(sales_since_2020)
+   return {
+       'median_price': float(median_price),
+       'price_increase_pct': float((median_price - older_prices) / older_prices * 100),
+       'affordable_home_price': affordable_home_price,
+       'affordability_gap': float(median_price - affordable_home_price),
+       'affordable_pct': (homes_affordable / total_recent_sales * 100) if total_recent_sales > 0 else 0,
+       'income_needed': float(median_price / 3)  # Income needed for median home
+   }
+
+# Load the data the top of the page needs; later sections load theirs with load_lazily
 def load_all_data():
    try:
        data = {
-           'sales': pd.read_csv('Real_Estate_Sales.csv'),
-           'all_assessments': pd.read_csv('Real_Estate_All_Assessments.csv'),
-           'parcel_boundary_details': pd.read_csv('Parcel_Boundary_Area_Details.csv')
+           'sales': load_sales(),
+           **load_yearly_tables()
        }
        return data
    except Exception as e:
        st.error(f"Error loading data: {str(e)}")
        return None
 
-# Process sales data
-@st.cache_data
-def process_sales_data(sales_df):
-   sales = sales_df.copy()
-   sales['SaleDate'] = pd.to_datetime(sales['SaleDate'], format='%Y/%m/%d %H:%M:%S+00', errors='coerce')
-   sales = sales.dropna(subset=['SaleDate'])
-   sales['Year'] = sales['SaleDate'].dt.year
-   sales['Month'] = sales['SaleDate'].dt.month
-   sales = sales[(sales['SaleAmount'] > 10000)] # Filter out sales below $10,000 AS these are likely non-market transactions
-   return sales
+# Load a section's data behind a spinner once the page above it has rendered
+def load_lazily(loader, message):
+   try:
+       with st.spinner(message):
+           return loader()
+   except Exception as e:
+       st.error(f"Error loading data: {str(e)}")
+       return None
+
+# Draw a line as two traces: muted up to split_year, highlighted afterwards
+def add_split_line(fig, x, y, pre_color, post_color, split_year=2021):
+   x = x.to_numpy(dtype=np.float64, na_value=np.nan)
+   y = y.to_numpy(dtype=np.float64, na_value=np.nan)
+   pre_mask = x <= split_year
+   # The highlighted run starts at the last muted point so the line stays continuous
+   post_mask = np.arange(len(x)) >= pre_mask.sum() - 1
+   for mask, line_color in [(pre_mask, pre_color), (post_mask, post_color)]:
+       if mask.sum() > 1:
+           fig.add_trace(go.Scattergl(
+               x=x[mask],
+               y=y[mask],
+               mode='lines',
+               line=dict(color=line_color, width=3),
+               showlegend=False,
+               hoverinfo='skip'
+           ))
+
+# Static copy for the ownership section; only the summary's numbers change between runs
+_NOTE_MD = """
+   ### 📝 What This Means
+   
+   **Local Ownership** includes:
+   - Properties owned by people with Charlottesville, VA addresses
+   - Residents who live in the community
+   
+   **Non-Local Ownership** includes:
+   - Out-of-state investors
+   - Property management companies
+   - Landlords from other cities/states
+   
+   ### 🏘️ Community Impact
+   
+   When properties are owned by non-locals:
+   - **Higher rents** as investments prioritize profits
+   - **Less community investment** and neighborhood stability  
+   - **Wealth extraction** - profits leave our local economy
+   - **Reduced local control** over housing decisions
+"""
+
+_SUMMARY_TEMPLATE = """
+   ### The Complete Picture
+   
+   **The Affordability Crisis:**
+   - Home prices have increased {total_increase:.0f}% since 2000, far outpacing income growth
+   - Only {affordable_pct:.1f}% of recent home sales are affordable to median-income families
+   - The gap between what people earn and what homes cost keeps growing
+   - The medin home price increased by **{recent_increase:.0f}%** from 2020 to 2024 alone, making it impossible for many families to buy a home
+   - House crisis ivolves everyone, but especially impacts Black families who face a much larger affordability gap
+   
+   **Who Controls the City:**
+   - **{local_pct:.1f}%** of properties are owned by Charlottesville residents
+   - **{non_local_pct:.1f}%** are owned by non-local investors, landlords, or institutions
+   - Non-local owners control **{non_local_land_pct:.1f}%** of the total land area
+   - That's approximately **{non_local_acres:.0f} acres** controlled by outsiders
+   - UVA is the largest single property owner by assessed value, controlling more than all other major owners combined.
+   - The City of Charlottesville owns more properties by number and land size, but the university dwarfs top property owners by assessed value.
+   
+   **This isn't just about numbers - it's about our community's future and who gets to call Charlottesville home.**
+
+"""
 
 # Load data
 data = load_all_data()
 
 if data:
-   sales_processed = process_sales_data(data['sales'])
-   
    # Community Impact Overview
    st.header("Housing Affordability Crisis Overview")
    
    # Calculate key community metrics
    median_income = 69829  # 2023 median household income in Charlottesville
-   affordable_home_price = median_income * 3  # Traditional affordability ratio
-   Last_Year_median_price = sales_processed[sales_processed['Year'] >= 2024]['SaleAmount'].median()
-   affordability_gap = Last_Year_median_price - affordable_home_price
-   
-   # Recent price changes
-   recent_prices = sales_processed[sales_processed['Year'] >= 2024]['SaleAmount'].median()
-   older_prices = sales_processed[sales_processed['Year'] >= 2020]['SaleAmount'].median()
-   price_increase_pct = ((recent_prices - older_prices) / older_prices) * 100
-   
-   col1, col2, col3, col4 = st.columns(4)
-   with col1:
-       st.metric(
-           "Median Home Price (2024)",
-           f"${Last_Year_median_price:,.0f}",
-           f"↑ {price_increase_pct:.0f}% vs 2020",
-           delta_color="inverse" 
-       )
-   with col2:
-       st.metric(
-           "Affordable Price \n (Based on median income in 2023.)",
-           f"${affordable_home_price:,.0f}",
-           f"Gap: ${affordability_gap:,.0f}",
-           delta_color="off"
-       )
-   with col3:
-       homes_affordable = len(sales_processed[(sales_processed['Year'] >= 2020) & 
-                                             (sales_processed['SaleAmount'] <= affordable_home_price)])
-       total_recent_sales = len(sales_processed[sales_processed['Year'] >= 2020])
-       affordable_pct = (homes_affordable / total_recent_sales * 100) if total_recent_sales > 0 else 0
-       st.metric(
-           "Affordable Home Sales %",
-           f"{affordable_pct:.1f}%",
-           "Since 2020",
-           delta_color="off"
-       )
-   with col4:
-       income_needed = Last_Year_median_price / 3  # Income needed for median home
-       st.metric(
-           "Income Needed for Median Home",
-           f"${income_needed:,.0f}",
-           f"{income_needed/median_income:.1f}x median income",
-           delta_color="off"
-       )
+   overview = compute_overview_metrics(median_income)
+   affordable_pct = overview['affordable_pct']
+   
+   overview_metrics = [
+       ("Median Home Price (2024)",
+        f"${overview['median_price']:,.0f}",
+        f"↑ {overview['price_increase_pct']:.0f}% vs 2020",
+        "inverse"),
+       ("Affordable Price \n (Based on median income in 2023.)",
+        f"${overview['affordable_home_price']:,.0f}",
+        f"Gap: ${overview['affordability_gap']:,.0f}",
+        "off"),
+       ("Affordable Home Sales %",
+        f"{affordable_pct:.1f}%",
+        "Since 2020",
+        "off"),
+       ("Income Needed for Median Home",
+        f"${overview['income_needed']:,.0f}",
+        f"{overview['income_needed']/median_income:.1f}x median income",
+        "off")
+   ]
+   for col, (label, value, delta, delta_color) in zip(st.columns(4), overview_metrics):
+       col.metric(label, value, delta, delta_color=delta_color)
    
    #Start the story
    st.header("The Story of Charlottesville's Housing Crisis")
@@ -189,13 +428,12 @@ if data:
    """)
    
    # Price increase narrative
-   yearly_stats = sales_processed.groupby('Year')['SaleAmount'].agg(['median', 'mean', 'count']).reset_index()
-   yearly_stats.columns = ['Year', 'MedianPrice', 'AveragePrice', 'Sales']
-   yearly_stats = yearly_stats[yearly_stats['Year'] >= 2000]
+   yearly_stats = data['yearly_stats']
    
    # Calculate key statistics for the narrative
-   price_2000 = yearly_stats[yearly_stats['Year'] == 2000]['MedianPrice'].iloc[0] if len(yearly_stats[yearly_stats['Year'] == 2000]) > 0 else 0
-   price_2024 = yearly_stats[yearly_stats['Year'] == 2024]['MedianPrice'].iloc[0] if len(yearly_stats[yearly_stats['Year'] == 2024]) > 0 else 0
+   median_price_by_year = yearly_stats.set_index('Year')['MedianPrice']
+   price_2000 = median_price_by_year.get(2000, 0)
+   price_2024 = median_price_by_year.get(2024, 0)
    total_increase = ((price_2024 - price_2000) / price_2000 * 100) if price_2000 > 0 else 0
    
    st.markdown(f"""
@@ -209,92 +447,32 @@ if data:
    # The Growing Affordability Gap Chart
    st.subheader("The Growing Affordability Gap")
    
-   # Calculate 75th percentile
-   percentile_75 = sales_processed.groupby('Year')['SaleAmount'].quantile(0.75).reset_index()
-   percentile_75.columns = ['Year', 'Percentile75']
-   yearly_stats = yearly_stats.merge(percentile_75, on='Year', how='left')
-   
-   # Income mapping
-   income_by_year = {
-       2000: 32903, 2001: 33223, 2002: 32785, 2003: 31363, 2004: 31246,
-       2005: 33041, 2006: 35147, 2007: 37195, 2008: 42948, 2009: 39030,
-       2010: 42240, 2011: 43980, 2012: 44535, 2013: 44601, 2014: 47218,
-       2015: 49775, 2016: 50727, 2017: 54739, 2018: 58933, 2019: 59471,
-       2020: 59598, 2021: 63470, 2022: 67177, 2023: 69829, 2024: None
-   }
-   
-   yearly_stats['MedianIncome'] = yearly_stats['Year'].map(income_by_year)
-   yearly_stats['AffordablePrice'] = yearly_stats['MedianIncome'] * 3
+   # Income lookup (years without data stay NaN)
+   income_idx = yearly_stats['Year'].to_numpy(dtype=np.int64) - INCOME_START_YEAR
+   has_income = (income_idx >= 0) & (income_idx < len(INCOME_BY_YEAR))
+   median_income_by_year = np.where(has_income, INCOME_BY_YEAR[np.clip(income_idx, 0, len(INCOME_BY_YEAR) - 1)], np.nan)
+   yearly_stats = yearly_stats.assign(MedianIncome=median_income_by_year, AffordablePrice=median_income_by_year * 3)
    
    # Calculate the price increase from 2020 to 2024
-   price_2020 = yearly_stats[yearly_stats['Year'] == 2020]['MedianPrice'].iloc[0] if len(yearly_stats[yearly_stats['Year'] == 2020]) > 0 else 0
-   price_2024 = yearly_stats[yearly_stats['Year'] == 2024]['MedianPrice'].iloc[0] if len(yearly_stats[yearly_stats['Year'] == 2024]) > 0 else 0
+   price_2020 = median_price_by_year.get(2020, 0)
    recent_increase = ((price_2024 - price_2020) / price_2020 * 100) if price_2020 > 0 else 0
    
    # Create the figure
    fig_afford = go.Figure()
    
    # Add median price line 
-   for i in range(len(yearly_stats)):
-       if i > 0:
-           # Determine color based on year
-           if yearly_stats.iloc[i]['Year'] <= 2021:
-               line_color = 'lightgray'
-           else:
-               line_color = '#1f77b4'
-           
-           # Draw line segment
-           fig_afford.add_trace(go.Scatter(
-               x=[yearly_stats.iloc[i-1]['Year'], yearly_stats.iloc[i]['Year']],
-               y=[yearly_stats.iloc[i-1]['MedianPrice'], yearly_stats.iloc[i]['MedianPrice']],
-               mode='lines',
-               line=dict(color=line_color, width=3),
-               showlegend=False,
-               hoverinfo='skip'
-           ))
+   add_split_line(fig_afford, yearly_stats['Year'], yearly_stats['MedianPrice'], 'lightgray', '#1f77b4')
    
    # Add average price line 
-   for i in range(len(yearly_stats)):
-       if i > 0:
-           # Determine color based on year
-           if yearly_stats.iloc[i]['Year'] <= 2021:
-               line_color = 'darkgray'
-           else:
-               line_color = '#ff7f0e'  
-           
-           # Draw line segment
-           fig_afford.add_trace(go.Scatter(
-               x=[yearly_stats.iloc[i-1]['Year'], yearly_stats.iloc[i]['Year']],
-               y=[yearly_stats.iloc[i-1]['AveragePrice'], yearly_stats.iloc[i]['AveragePrice']],
-               mode='lines',
-               line=dict(color=line_color, width=3),
-               showlegend=False,
-               hoverinfo='skip'
-           ))
+   add_split_line(fig_afford, yearly_stats['Year'], yearly_stats['AveragePrice'], 'darkgray', '#ff7f0e')
    
    # Add 75th percentile line 
-   for i in range(len(yearly_stats)):
-       if i > 0:
-           # Determine color based on year
-           if yearly_stats.iloc[i]['Year'] <= 2021:
-               line_color = 'darkgray'
-           else:
-               line_color = '#838530'
-           
-           # Draw line segment
-           fig_afford.add_trace(go.Scatter(
-               x=[yearly_stats.iloc[i-1]['Year'], yearly_stats.iloc[i]['Year']],
-               y=[yearly_stats.iloc[i-1]['Percentile75'], yearly_stats.iloc[i]['Percentile75']],
-               mode='lines',
-               line=dict(color=line_color, width=3),
-               showlegend=False,
-               hoverinfo='skip'
-           ))
+   add_split_line(fig_afford, yearly_stats['Year'], yearly_stats['Percentile75'], 'darkgray', '#838530')
    
    # Add markers only for post-2021 data
    post_2021_data = yearly_stats[yearly_stats['Year'] > 2021]
    
-   fig_afford.add_trace(go.Scatter(
+   fig_afford.add_trace(go.Scattergl(
        x=post_2021_data['Year'],
        y=post_2021_data['MedianPrice'],
        mode='markers',
@@ -303,7 +481,7 @@ if data:
        hovertemplate='%{y:$,.0f}<extra></extra>'
    ))
    
-   fig_afford.add_trace(go.Scatter(
+   fig_afford.add_trace(go.Scattergl(
        x=post_2021_data['Year'],
        y=post_2021_data['AveragePrice'],
        mode='markers',
@@ -312,7 +490,7 @@ if data:
        hovertemplate='%{y:$,.0f}<extra></extra>'
    ))
    
-   fig_afford.add_trace(go.Scatter(
+   fig_afford.add_trace(go.Scattergl(
        x=post_2021_data['Year'],
        y=post_2021_data['Percentile75'],
        mode='markers',
@@ -322,7 +500,7 @@ if data:
    ))
    
    # Affordable price 
-   fig_afford.add_trace(go.Scatter(
+   fig_afford.add_trace(go.Scattergl(
        x=yearly_stats['Year'], 
        y=yearly_stats['AffordablePrice'],
        mode='lines+markers',
@@ -380,17 +558,13 @@ if data:
    # Assessment Values Over Time
    st.subheader("Property Assessment Values Over Time")
    
-   # Process assessment data
-   all_assessments = data['all_assessments'].copy()
-   assessment_stats = all_assessments.groupby('TaxYear')['TotalValue'].agg(['median', 'mean']).reset_index()
-   assessment_stats.columns = ['Year', 'MedianAssessment', 'AverageAssessment']
-   assessment_stats = assessment_stats[assessment_stats['Year'] >= 2000]
+   assessment_stats = data['assessment_stats']
    
    # Create the assessment chart
    fig_assessment = go.Figure()
    
    #  median assessment line
-   fig_assessment.add_trace(go.Scatter(
+   fig_assessment.add_trace(go.Scattergl(
        x=assessment_stats['Year'],
        y=assessment_stats['MedianAssessment'],
        mode='lines+markers',
@@ -400,7 +574,7 @@ if data:
    ))
    
    #  average assessment line
-   fig_assessment.add_trace(go.Scatter(
+   fig_assessment.add_trace(go.Scattergl(
        x=assessment_stats['Year'],
        y=assessment_stats['AverageAssessment'],
        mode='lines+markers',
@@ -410,7 +584,7 @@ if data:
    ))
    
    # Calculate assessment increase
-   assessment_2021 = assessment_stats[assessment_stats['Year'] == 2021]['MedianAssessment'].iloc[0] if len(assessment_stats[assessment_stats['Year'] == 2021]) > 0 else 0
+   assessment_2021 = assessment_stats.set_index('Year')['MedianAssessment'].get(2021, 0)
    assessment_latest = assessment_stats.iloc[-1]['MedianAssessment']
    assessment_increase = ((assessment_latest - assessment_2021) / assessment_2021 * 100) if assessment_2021 > 0 else 0
 
@@ -487,34 +661,18 @@ if data:
    st.subheader("Sales Activity Over Time")
    
    #  sales count by year since 2000
-   sales_by_year = sales_processed[sales_processed['Year'] >= 2000].groupby('Year').size().reset_index(name='SalesCount')
+   sales_by_year = data['sales_by_year']
    
    # sales activity chart
    fig_sales = go.Figure()
    
    #  sales count line 
-   for i in range(len(sales_by_year)):
-       if i > 0:
-           # Determine color based on year
-           if sales_by_year.iloc[i]['Year'] <= 2021:
-               line_color = 'lightgray'
-           else:
-               line_color = '#1f77b4'
-           
-           # Draw line segment
-           fig_sales.add_trace(go.Scatter(
-               x=[sales_by_year.iloc[i-1]['Year'], sales_by_year.iloc[i]['Year']],
-               y=[sales_by_year.iloc[i-1]['SalesCount'], sales_by_year.iloc[i]['SalesCount']],
-               mode='lines',
-               line=dict(color=line_color, width=3),
-               showlegend=False,
-               hoverinfo='skip'
-           ))
+   add_split_line(fig_sales, sales_by_year['Year'], sales_by_year['SalesCount'], 'lightgray', '#1f77b4')
    
    #  markers only for post-2021 data
    post_2021_sales = sales_by_year[sales_by_year['Year'] > 2021]
    
-   fig_sales.add_trace(go.Scatter(
+   fig_sales.add_trace(go.Scattergl(
        x=post_2021_sales['Year'],
        y=post_2021_sales['SalesCount'],
        mode='markers',
@@ -532,8 +690,9 @@ if data:
    )
    
    # Calculate recent sales trend
-   sales_2021 = sales_by_year[sales_by_year['Year'] == 2021]['SalesCount'].iloc[0] if len(sales_by_year[sales_by_year['Year'] == 2021]) > 0 else 0
-   sales_2024 = sales_by_year[sales_by_year['Year'] == 2024]['SalesCount'].iloc[0] if len(sales_by_year[sales_by_year['Year'] == 2024]) > 0 else 0
+   sales_count_by_year = sales_by_year.set_index('Year')['SalesCount']
+   sales_2021 = sales_count_by_year.get(2021, 0)
+   sales_2024 = sales_count_by_year.get(2024, 0)
    sales_change = ((sales_2024 - sales_2021) / sales_2021 * 100) if sales_2021 > 0 else 0
    
    #  annotation about recent sales activity
@@ -712,14 +871,13 @@ if data:
        help="Type part of an address to search."
    )
    
-   if search_address:
-       all_assessments = data['all_assessments'].copy()
-       all_assessments['FullAddress'] = all_assessments['StreetNumber'].astype(str) + ' ' + all_assessments['StreetName'].astype(str)
-       
-       matching_properties = all_assessments[
-           all_assessments['FullAddress'].str.contains(search_address.upper(), case=False, na=False) |
-           all_assessments['StreetName'].str.contains(search_address.upper(), case=False, na=False)
-       ]
+   query = search_address.strip().upper()
+   if 0 < len(query) < MIN_SEARCH_LENGTH:
+       st.info(f"Type at least {MIN_SEARCH_LENGTH} characters to search.")
+   elif query:
+       all_assessments = load_lazily(load_assessments, "Loading assessment records...")
+       # On a load error only the search is skipped; the rest of the page still renders
+       matching_properties = search_addresses(query) if all_assessments is not None else pd.DataFrame()
        
        if len(matching_properties) > 0:
            unique_addresses = matching_properties[['ParcelNumber', 'FullAddress']].drop_duplicates()
@@ -741,7 +899,7 @@ if data:
                
                with col1:
                    fig_assessment = go.Figure()
-                   fig_assessment.add_trace(go.Scatter(
+                   fig_assessment.add_trace(go.Scattergl(
                        x=property_history['TaxYear'],
                        y=property_history['TotalValue'],
                        mode='lines+markers',
@@ -779,25 +937,22 @@ if data:
    """)
    
    # Load and process the parcel boundary data
-   parcel_details = data['parcel_boundary_details'].copy()
-   
-   # Clean the data and identify local vs non-local owners
-   parcel_details = parcel_details.dropna(subset=['OwnerCityState'])
-   parcel_details = parcel_details.copy()
-   parcel_details.loc[:, 'OwnerCityState_Clean'] = parcel_details['OwnerCityState'].astype(str).str.strip().str.upper()
-   parcel_details.loc[:, 'IsLocal'] = parcel_details['OwnerCityState_Clean'] == 'CHARLOTTESVILLE VA'
-   
-   # Calculate ownership statistics
-   total_parcels = len(parcel_details)
-   local_parcels = parcel_details['IsLocal'].sum()
-   non_local_parcels = total_parcels - local_parcels
-   local_pct = (local_parcels / total_parcels * 100) if total_parcels > 0 else 0
-   
-   # Calculate land area statistics
-   total_land_area = parcel_details['LotSquareFeet'].sum()
-   local_land_area = parcel_details[parcel_details['IsLocal']]['LotSquareFeet'].sum()
-   non_local_land_area = parcel_details[~parcel_details['IsLocal']]['LotSquareFeet'].sum()
-   local_land_pct = (local_land_area / total_land_area * 100) if total_land_area > 0 else 0
+   parcel_details = load_lazily(load_parcels, "Loading property ownership data...")
+   if parcel_details is None:
+       st.stop()
+   
+   # Calculate ownership and land area statistics
+   ownership = compute_ownership_summary()
+   total_parcels = ownership['total_parcels']
+   local_parcels = ownership['local_parcels']
+   non_local_parcels = ownership['non_local_parcels']
+   local_pct = ownership['local_pct']
+   non_local_land_area = ownership['non_local_land_area']
+   local_land_pct = ownership['local_land_pct']
+   # Non-local figures shown in both the metrics and the summary
+   non_local_pct = 100 - local_pct
+   non_local_land_pct = 100 - local_land_pct
+   non_local_acres = non_local_land_area / 43560
    
    # Display key metrics
    col1, col2, col3, col4 = st.columns(4)
@@ -806,152 +961,45 @@ if data:
    with col2:
        st.metric("Local Ownership", f"{local_pct:.1f}%", f"{local_parcels:,} properties")
    with col3:
-       st.metric("Non-Local Ownership", f"{100-local_pct:.1f}%", f"{non_local_parcels:,} properties")
+       st.metric("Non-Local Ownership", f"{non_local_pct:.1f}%", f"{non_local_parcels:,} properties")
    with col4:
-       st.metric("Non-Local Land Control", f"{100-local_land_pct:.1f}%", f"{non_local_land_area/43560:.0f} acres")
+       st.metric("Non-Local Land Control", f"{non_local_land_pct:.1f}%", f"{non_local_acres:.0f} acres")
    
    # Top Property Owners Analysis
    st.subheader("Who Are The Biggest Property Owners?")
    
-   try:
-       # Calculate top owners directly from parcel_details
-       if 'Assessment' in parcel_details.columns:
-           top_owners = (
-               parcel_details.groupby('OwnerName')
-               .agg(
-                   TotalProperties=('OwnerName', 'size'),
-                   TotalSquareFeet=('LotSquareFeet', 'sum'),
-                   TotalAssessment=('Assessment', 'sum')
-               )
-               .reset_index()
-           )
-       else:
-           top_owners = (
-               parcel_details.groupby('OwnerName')
-               .agg(
-                   TotalProperties=('OwnerName', 'size'),
-                   TotalSquareFeet=('LotSquareFeet', 'sum')
-               )
-               .reset_index()
-           )
-           top_owners['TotalAssessment'] = 0
-       
-       # Sort by total properties
-       top_owners = top_owners.sort_values(by='TotalProperties', ascending=False)
-       
-       top_owners['TotalAcres'] = top_owners['TotalSquareFeet'] / 43560
-       top_owners['FormattedAcres'] = top_owners['TotalAcres'].apply(lambda x: f"{x:.1f} acres")
-       top_owners['FormattedAssessment'] = top_owners['TotalAssessment'].apply(lambda x: f"${x:,.0f}")
+   top_owners, owners_error = safe_top_owners()
+   if owners_error is not None:
+       st.error(f"Error analyzing top property owners: {str(owners_error)}")
+       st.write("Available columns in parcel_details:", parcel_details.columns.tolist())
+   else:
+       # Only the rows shown in the table get formatted strings
+       table_owners = top_owners.nlargest(OWNER_TABLE_ROWS, 'TotalProperties').assign(
+           FormattedAssessment=lambda df: df['TotalAssessment'].map('${:,.0f}'.format)
+       )
        
        # Show expandable table
        st.markdown("**Click to expand and see more property owners:**")
        
        # Create display dataframe
-       display_columns = ['OwnerName', 'TotalProperties']
-       if 'Assessment' in parcel_details.columns:
-           display_columns.append('FormattedAssessment')
-       
-       display_df = top_owners[display_columns].copy()
-       display_df.columns = ['Owner Name', 'Properties', 'Total Assessment Value'] + (['Total Assessment Value'] if len(display_columns) > 3 else [])
+       display_df = table_owners[['OwnerName', 'TotalProperties', 'FormattedAssessment']].rename(columns={
+           'OwnerName': 'Owner Name',
+           'TotalProperties': 'Properties',
+           'FormattedAssessment': 'Total Assessment Value'
+       })
+       # Arrow strings serialize without object conversion, and unlike the category
+       # column they don't carry every owner name along with the 200 shown
+       display_df = display_df.astype({'Owner Name': 'string[pyarrow]', 'Total Assessment Value': 'string[pyarrow]'})
        
        # Use expander for the table
        with st.expander("Property Owners Table", expanded=True):
-           st.dataframe(display_df, use_container_width=True, height=None)
-       
-       # Get top 10 for charts
-       top_10_owners = top_owners.head(10)
-       
-       
-       fig_top_owners = px.bar(
-               top_10_owners,
-               x='TotalProperties',
-               y='OwnerName',
-               title='Top 10 Owners by Number of Properties',
-               labels={'OwnerName': 'Owner Name', 'TotalProperties': 'Number of Properties'},
-               text='TotalProperties',
-               color='TotalProperties',
-               color_continuous_scale='Blues',
-               orientation='h'
-         )
-       fig_top_owners.update_layout(
-               yaxis={'categoryorder': 'total ascending'},
-               height=500
-        )
-       st.plotly_chart(fig_top_owners, use_container_width=True)
+           st.dataframe(display_df, use_container_width=True)
        
+       st.plotly_chart(build_top_owners_bar(), use_container_width=True)
        
        # assessment values CHART
-       if 'TotalAssessment' in top_10_owners.columns:
-           st.subheader("And Here's What Their Properties Are Really Worth")
-           
-           # Create the figure 
-           fig_assessment = go.Figure()
-           
-           # Sort data for the chart
-           assessment_data = top_10_owners.sort_values('TotalAssessment', ascending=True)
-           
-           
-           for i in range(len(assessment_data)):
-               if i >= len(assessment_data) - 2:  # Top 2 bars
-                   bar_color = '#1f77b4'  
-               else:
-                   bar_color = 'lightgray' 
-               
-               # Add each bar individually
-               fig_assessment.add_trace(go.Bar(
-                   x=[assessment_data.iloc[i]['TotalAssessment']],
-                   y=[assessment_data.iloc[i]['OwnerName']],
-                   orientation='h',
-                   marker_color=bar_color,
-                   showlegend=False,
-                   text=f"${assessment_data.iloc[i]['TotalAssessment']:,.0f}",
-                   textposition='outside',
-                   hovertemplate='%{text}<extra></extra>'
-               ))
-           
-           # layout
-           fig_assessment.update_layout(
-               title=dict(
-                   text='Top 10 Property Owners by Total Assessment Value',
-                   font=dict(color='#1f77b4', size=20)
-               ),
-               xaxis_title='Total Assessment Value ($)',
-               yaxis_title='',
-               height=600,
-               margin=dict(l=300),
-               font=dict(color='#6c757d'),
-               xaxis=dict(
-                   gridcolor='lightgray',
-                   tickformat='$,.0f'
-               ),
-               bargap=0.15,
-               barmode='overlay'
-           )
-           
-           # Add annotation 
-           fig_assessment.add_annotation(
-               x=assessment_data.iloc[-1]['TotalAssessment'] * 0.8,  
-               y=len(assessment_data) - 1.5,  
-               text="<b>Key Finding:</b><br>The top property owner by<br>assessment value controls significantly<br>more valuable real estate than all other major owners combined.<br>While the City of Charlottesville owns more properties in the city<br> by number and land size, the university dwarfs top property owners by assessed value",
-               showarrow=True,
-               arrowhead=2,
-               arrowsize=1,
-               arrowwidth=2,
-               arrowcolor="gray",
-               ax=0,    
-               ay=100,  
-               bgcolor="rgba(255,255,255,0.9)",
-               bordercolor="rgba(0,0,0,0)",
-               borderwidth=0,
-               font=dict(size=12, color="gray"),
-               align="center"
-           )
-           
-           st.plotly_chart(fig_assessment, use_container_width=True)
-           
-   except Exception as e:
-       st.error(f"Error analyzing top property owners: {str(e)}")
-       st.write("Available columns in parcel_details:", list(parcel_details.columns))
+       st.subheader("And Here's What Their Properties Are Really Worth")
+       st.plotly_chart(build_assessment_fig(), use_container_width=True)
    
    #  pie chart for ownership 
    st.subheader("The Big Picture: Local vs Outside Control")
@@ -960,71 +1008,25 @@ if data:
    chart_col, note_col = st.columns([1, 1])
    
    with chart_col:
-       ownership_data = pd.DataFrame({
-           'Type': ['Local', 'Non-Local'],
-           'Count': [local_parcels, non_local_parcels]
-       })
-       
-       fig = px.pie(ownership_data, values='Count', names='Type', 
-                   title='Local vs Non-Local Ownership',
-                   color_discrete_map={'Local': '#2E8B57', 'Non-Local': '#DC143C'})
-       
-       fig.update_layout(
-           height=400,
-           width=400,
-           showlegend=True,
-           legend=dict(orientation="v", yanchor="top", y=1, xanchor="left", x=1.05)
-       )
-       st.plotly_chart(fig, use_container_width=False)
+       st.plotly_chart(build_ownership_pie(local_parcels, non_local_parcels), use_container_width=False)
    
    with note_col:
-       st.markdown("""
-       ### 📝 What This Means
-       
-       **Local Ownership** includes:
-       - Properties owned by people with Charlottesville, VA addresses
-       - Residents who live in the community
-       
-       **Non-Local Ownership** includes:
-       - Out-of-state investors
-       - Property management companies
-       - Landlords from other cities/states
-       
-       ### 🏘️ Community Impact
-       
-       When properties are owned by non-locals:
-       - **Higher rents** as investments prioritize profits
-       - **Less community investment** and neighborhood stability  
-       - **Wealth extraction** - profits leave our local economy
-       - **Reduced local control** over housing decisions
-       """)
+       st.markdown(_NOTE_MD)
    
    
    
    # Summary Section - End of the story
    st.header("What This All Means for Our Community")
    
-   st.markdown(f"""
-   ### The Complete Picture
-   
-   **The Affordability Crisis:**
-   - Home prices have increased {total_increase:.0f}% since 2000, far outpacing income growth
-   - Only {affordable_pct:.1f}% of recent home sales are affordable to median-income families
-   - The gap between what people earn and what homes cost keeps growing
-   - The medin home price increased by **{recent_increase:.0f}%** from 2020 to 2024 alone, making it impossible for many families to buy a home
-   - House crisis ivolves everyone, but especially impacts Black families who face a much larger affordability gap
-   
-   **Who Controls the City:**
-   - **{local_pct:.1f}%** of properties are owned by Charlottesville residents
-   - **{100-local_pct:.1f}%** are owned by non-local investors, landlords, or institutions
-   - Non-local owners control **{100-local_land_pct:.1f}%** of the total land area
-   - That's approximately **{non_local_land_area/43560:.0f} acres** controlled by outsiders
-   - UVA is the largest single property owner by assessed value, controlling more than all other major owners combined.
-   - The City of Charlottesville owns more properties by number and land size, but the university dwarfs top property owners by assessed value.
-   
-   **This isn't just about numbers - it's about our community's future and who gets to call Charlottesville home.**
-
-   """)
+   st.markdown(_SUMMARY_TEMPLATE.format(
+       total_increase=total_increase,
+       affordable_pct=affordable_pct,
+       recent_increase=recent_increase,
+       local_pct=local_pct,
+       non_local_pct=non_local_pct,
+       non_local_land_pct=non_local_land_pct,
+       non_local_acres=non_local_acres
+   ))
 
 else:
    st.error("Unable to load data. Please check file paths and try again.")
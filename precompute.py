@@ -0,0 +1,108 @@
+"""Precompute the yearly aggregates behind the dashboard charts.
+
+The source CSVs only change when the city publishes new data, so the yearly
+tables are built once and stored as small Parquet files in cache/. The app
+rebuilds and writes them itself when they are missing or stale; running this
+after updating any of the CSVs keeps that work off the first page load:
+
+   python precompute.py
+"""
+import os
+
+import numpy as np
+import pandas as pd
+
+SALES_CSV = 'Real_Estate_Sales.csv'
+ASSESSMENTS_CSV = 'Real_Estate_All_Assessments.csv'
+CACHE_DIR = 'cache'
+TABLES = ['yearly_stats', 'assessment_stats', 'sales_by_year']
+
+# Only the columns the dashboard uses are read from each CSV.
+# Dollar amounts are whole numbers that exceed float32's exact range, so they are kept as int32.
+SALES_COLUMNS = ['SaleDate', 'SaleAmount']
+SALES_DTYPES = {'SaleAmount': 'int32[pyarrow]'}
+ASSESSMENT_COLUMNS = ['ParcelNumber', 'TotalValue', 'TaxYear', 'StreetName', 'StreetNumber']
+ASSESSMENT_DTYPES = {'TotalValue': 'int32[pyarrow]', 'TaxYear': 'int16[pyarrow]', 'StreetName': 'category'}
+
+
+def read_sales(path=SALES_CSV):
+   sales = pd.read_csv(path, engine='pyarrow', dtype_backend='pyarrow', usecols=SALES_COLUMNS, dtype=SALES_DTYPES, parse_dates=['SaleDate'])
+   return (
+       sales.dropna(subset=['SaleDate'])
+       .assign(
+           Year=lambda df: df['SaleDate'].dt.year.astype('int16[pyarrow]'),
+           Month=lambda df: df['SaleDate'].dt.month
+       )
+       .query('SaleAmount > 10000') # Filter out sales below $10,000 AS these are likely non-market transactions
+       .reset_index(drop=True)
+   )
+
+
+def read_assessments(path=ASSESSMENTS_CSV):
+   return pd.read_csv(path, engine='pyarrow', dtype_backend='pyarrow', usecols=ASSESSMENT_COLUMNS, dtype=ASSESSMENT_DTYPES)
+
+
+def compute_yearly_stats(sales):
+   """Median, mean, count and 75th percentile of SaleAmount per year since 2000."""
+   # Sort by year once and read every statistic off each year's slice
+   sales = sales[sales['Year'] >= 2000]
+   years = sales['Year'].to_numpy(dtype=np.int64)
+   order = np.argsort(years, kind='stable')
+   years = years[order]
+   amounts = sales['SaleAmount'].to_numpy(dtype=np.float64)[order]
+   group_years, starts = np.unique(years, return_index=True)
+   groups = np.split(amounts, starts[1:])
+   # One partition per year gives both the median and the 75th percentile
+   percentiles = np.array([np.percentile(group, [50, 75]) for group in groups]).reshape(-1, 2)
+   return pd.DataFrame({
+       'Year': pd.array(group_years, dtype=sales['Year'].dtype),
+       'MedianPrice': percentiles[:, 0],
+       'AveragePrice': [group.mean() for group in groups],
+       'Sales': np.diff(np.append(starts, len(years))),
+       'Percentile75': percentiles[:, 1]
+   })
+
+
+def compute_assessment_stats(assessments):
+   assessment_stats = assessments.groupby('TaxYear')['TotalValue'].agg(['median', 'mean']).reset_index()
+   assessment_stats.columns = ['Year', 'MedianAssessment', 'AverageAssessment']
+   return assessment_stats[assessment_stats['Year'] >= 2000].reset_index(drop=True)
+
+
+def compute_sales_by_year(sales):
+   return sales[sales['Year'] >= 2000].groupby('Year').size().reset_index(name='SalesCount')
+
+
+def build_tables(sales=None, assessments=None):
+   sales = read_sales() if sales is None else sales
+   assessments = read_assessments() if assessments is None else assessments
+   return {
+       'yearly_stats': compute_yearly_stats(sales),
+       'assessment_stats': compute_assessment_stats(assessments),
+       'sales_by_year': compute_sales_by_year(sales)
+   }
+
+
+def read_tables(cache_dir=CACHE_DIR):
+   """Return the cached tables, or None if any is missing or older than the CSVs or this file."""
+   paths = {name: os.path.join(cache_dir, f'{name}.parquet') for name in TABLES}
+   if not all(os.path.exists(path) for path in paths.values()):
+       return None
+   # Include this module so changes to the compute functions also invalidate the cache
+   newest_source = max(os.path.getmtime(SALES_CSV), os.path.getmtime(ASSESSMENTS_CSV), os.path.getmtime(__file__))
+   if min(os.path.getmtime(path) for path in paths.values()) < newest_source:
+       return None
+   return {name: pd.read_parquet(path, dtype_backend='pyarrow') for name, path in paths.items()}
+
+
+def write_tables(cache_dir=CACHE_DIR, tables=None):
+   tables = build_tables() if tables is None else tables
+   os.makedirs(cache_dir, exist_ok=True)
+   for name, table in tables.items():
+       table.to_parquet(os.path.join(cache_dir, f'{name}.parquet'), index=False)
+   return tables
+
+
+if __name__ == '__main__':
+   for name, table in write_tables().items():
+       print(f"Wrote {name} ({len(table)} rows)")